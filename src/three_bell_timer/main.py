@@ -1,11 +1,7 @@
 import argparse
 import sys
 
-from PyQt5 import QtCore, QtWidgets
-from PyQt5.QtGui import QIcon
-
-from .utils import generate_desktop_file, find_icon_file
-from .three_bell_timer import TimeSettingsDialog, PresentationTimerApp
+from .resources import generate_desktop_file, ICON_PATH
 
 
 def main():
@@ -32,14 +28,19 @@ def main():
         generate_desktop_file()
         sys.exit(0)
 
+    # Qt is imported only here so that --help and --generate-desktop do not pay for loading it.
+    from PyQt5 import QtCore, QtWidgets
+    from PyQt5.QtGui import QIcon
+
+    from .three_bell_timer import TimeSettingsDialog, PresentationTimerApp
+
     # Qt setting
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)  # enable highdpi scaling
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)  # use highdpi icons
 
     app = QtWidgets.QApplication(sys.argv)
-    icon_path = find_icon_file("icon.ico")
-    if icon_path:
-        app.setWindowIcon(QIcon(icon_path))
+    if ICON_PATH:
+        app.setWindowIcon(QIcon(ICON_PATH))
 
     if args.prompt_times:
         # Open dialog to specify bell times
@@ -0,0 +1,66 @@
+# Helpers that must not import PyQt5, so that CLI-only paths such as --help and
+# --generate-desktop start without loading Qt.
+import functools
+import os
+import platform
+import shutil
+import sys
+
+
+def generate_desktop_file():
+    if platform.system() != "Linux":
+        sys.exit("Error: .desktop file is valid only on Linux system.")
+
+    exec_path = shutil.which("3bt") or os.path.abspath(sys.argv[0])
+
+    icon_path = find_icon_file("icon256.png") or ""
+
+    desktop_file_content = f"""[Desktop Entry]
+Name=Three-bell timer
+Comment=A lightweight timer designed for presentations.
+Exec={exec_path}
+Icon={icon_path}
+Terminal=false
+Type=Application
+Categories=Utility;
+"""
+    dest_file = os.path.join(os.getcwd(), "3bt.desktop")
+
+    try:
+        with open(dest_file, "w") as f:
+            f.write(desktop_file_content)
+        print(f".desktop file generated at {dest_file}", file=sys.stderr)
+        print("To integrate with your system, copy this file to ~/.local/share/applications/", file=sys.stderr)
+        print("For example:", file=sys.stderr)
+        print("  cp 3bt.desktop ~/.local/share/applications/", file=sys.stderr)
+    except Exception as e:
+        sys.exit(f"Error: Failed to generate .desktop file: {e}")
+
+
+def _icon_base_dirs():
+    base_dirs = []
+    pkg_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "data"))
+    base_dirs.append(pkg_data_dir)
+    try:
+        pyinstaller_data_dir = sys._MEIPASS
+        base_dirs.append(pyinstaller_data_dir)
+    except Exception:
+        pass
+    base_dirs.append(os.path.abspath("."))
+    return tuple(base_dirs)
+
+
+_ICON_BASE_DIRS = _icon_base_dirs()
+
+
+@functools.lru_cache(maxsize=None)
+def find_icon_file(filename):
+    for b in _ICON_BASE_DIRS:
+        icon_path = os.path.join(b, filename)
+        if os.path.exists(icon_path):
+            return icon_path
+    return None
+
+
+# The search directories are fixed for the lifetime of the process, so the app icon is resolved once.
+ICON_PATH = find_icon_file("icon.ico")
@@ -1,17 +1,18 @@
 import math
 import sys
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import QPointF, QRectF, Qt
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtCore import QPointF, QRect, QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QPen
 
 try:
     from .__about__ import __version__
 except ImportError as e:
     __version__ = "(unknown)"
-from .utils import interpolate_rgb, interpolate_rgba, find_icon_file, calculate_window_position, paint_text_with_background
+from .resources import ICON_PATH
+from .utils import interpolate_rgb, interpolate_rgba, calculate_window_position, paint_text_with_background
 
 TEN_MINUTE_MARK_HEIGHT_SCALE = 1.25
 MARGIN_X = 4
@@ -24,6 +25,7 @@ MARKER_BORDER_RGBA = (69, 71, 76, 240)
 HINT_RGB = (13, 14, 15)
 PRESENTATION_RGB = (0, 117, 153)
 TOTAL_RGB = (229, 153, 82)
+TICK_INTERVAL_MS = 200  # the hand pulses with a 3 s period; 5 Hz keeps that smooth
 
 
 # ---- Time Settings Dialog ----
@@ -73,28 +75,31 @@ class TimerModel(QtCore.QObject):
         self.presentation_end: int = max(t1, t2)  # min
         self.total_minutes: int = max(self.presentation_end, t3)  # min
         self._accum: float = 0.0  # sec
-        self._start: float = time.time()  # sec
+        self._start: float = time.monotonic()  # sec
         self._paused: bool = True
 
     def tick(self) -> None:
+        # The elapsed time is frozen while paused, so there is nothing for views to redraw.
+        if self._paused:
+            return
         self.timeUpdated.emit()
 
     def toggle_pause(self) -> None:
         if self._paused:
-            self._start = time.time()
+            self._start = time.monotonic()
         else:
-            self._accum += time.time() - self._start
+            self._accum += time.monotonic() - self._start
         self._paused = not self._paused
         self.stateChanged.emit()
 
     def reset(self) -> None:
         self._accum = 0.0
-        self._start = time.time()
+        self._start = time.monotonic()
         self._paused = True
         self.stateChanged.emit()
 
     def elapsed(self) -> float:
-        return self._accum if self._paused else self._accum + (time.time() - self._start)
+        return self._accum if self._paused else self._accum + (time.monotonic() - self._start)
 
     @property
     def is_paused(self) -> bool:
@@ -108,62 +113,221 @@ class TimerBar(QtWidgets.QWidget):
         self.model = model
         self.running_height: int = running_height
         self.position: str = position
-        model.timeUpdated.connect(self.update)
+        self._marker_brush = QBrush(QColor(*MARKER_RGBA))
+        self._marker_border_pen = QPen(QColor(*MARKER_BORDER_RGBA), MARKER_BORDER_THICKNESS)
+        # Reused for the per-tick drawing; only their color/width change between paints.
+        self._marble_pen = QPen()
+        self._hand_color = QColor()
+        self._label_font = QtGui.QFont(self.font())
+        self._label_font.setBold(True)
+        self._play_button: Optional[QtGui.QPolygonF] = None
+        self._play_button_key: Optional[tuple] = None
+        # The three segment colors are fixed, so their brushes and pens are built once per bar.
+        self._segment_colors: Dict[Tuple[int, int, int], Tuple[QBrush, QBrush, QColor, QColor]] = {}
+        for base in (HINT_RGB, PRESENTATION_RGB, TOTAL_RGB):
+            light_rgb = interpolate_rgb(base, (255, 255, 255), 0.70)
+            self._segment_colors[base] = (
+                QBrush(QColor(*light_rgb, 150)),  # light fill
+                QBrush(QColor(*base, 220)),  # dark fill
+                QColor(*base),  # dark pen
+                QColor(*light_rgb),  # light pen
+            )
+        self._palette_key: Optional[tuple] = None
+        self._marble_colors: List[Tuple[QBrush, QBrush, QColor, QColor]] = []
+        self._geometry_key: Optional[tuple] = None
+        self._marble_geometry: List[Tuple[QRectF, float, int, int]] = []
+        self._marble_pixmap: Optional[QtGui.QPixmap] = None
+        self._marble_pixmap_key: Optional[tuple] = None
+        self._paused_pixmap: Optional[QtGui.QPixmap] = None
+        self._paused_pixmap_key: Optional[tuple] = None
+        self._last_tick_done: Optional[int] = None
+        model.timeUpdated.connect(self.onTimeUpdated)
         model.stateChanged.connect(self.update)
 
+    def onTimeUpdated(self) -> None:
+        # Ticks only arrive while running; pause/resume/reset come via stateChanged and repaint fully.
+        # Only the in-progress marble and the hand change between ticks, so repaint just the band
+        # from the marble in progress at the previous tick to the current one, padded for the hand.
+        total = self.model.total_minutes
+        done = min(int(self.model.elapsed() // 60), total)
+        prev_done = self._last_tick_done if self._last_tick_done is not None else done
+        self._last_tick_done = done
+        marble_width = (self.width() - MARGIN_X * 2) / total
+        pad = self.height() * 2
+        x0 = int(MARGIN_X + min(prev_done, done) * marble_width - pad)
+        x1 = int(MARGIN_X + (max(prev_done, done) + 1) * marble_width + pad) + 1
+        self.update(QRect(x0, 0, x1 - x0, self.height()))
+
+    def _update_palette(self) -> None:
+        # Colors only depend on which segment (hint/presentation/total) a minute belongs to,
+        # so the per-minute list is rebuilt only when a bell time changes.
+        key = (self.model.hint_time, self.model.presentation_end, self.model.total_minutes)
+        if key == self._palette_key:
+            return
+        hint_time, presentation_end, total_minutes = key
+        table = self._segment_colors
+        self._marble_colors = (
+            [table[HINT_RGB]] * hint_time
+            + [table[PRESENTATION_RGB]] * (presentation_end - hint_time)
+            + [table[TOTAL_RGB]] * (total_minutes - presentation_end)
+        )
+        self._palette_key = key
+
+    def _update_geometry(self, w: int, h: int) -> None:
+        # Marble rects, border widths and minute boundaries only change on resize, pause/resume,
+        # position or bell-time changes, so they are rebuilt only then.
+        key = (
+            w,
+            h,
+            self.model.is_paused,
+            self.position,
+            self.model.hint_time,
+            self.model.presentation_end,
+            self.model.total_minutes,
+        )
+        if key == self._geometry_key:
+            return
+        marble_width = w / self.model.total_minutes
+        geometry = []
+        for i in range(self.model.total_minutes):
+            # Snap marble edges to whole pixels; rounding both edges keeps the gaps between marbles even.
+            x0 = round(i * marble_width) + MARGIN_X
+            x1 = round((i + 1) * marble_width) + MARGIN_X
+            marble_height = h if (i + 1) % 10 == 0 else int(h / TEN_MINUTE_MARK_HEIGHT_SCALE)
+            y = h - marble_height if self.position == "bottom" else 0
+            rect = QRectF(x0 + PADDING, y + PADDING, x1 - x0 - 2 * PADDING, marble_height - 2 * PADDING)
+            is_last_min = (i + 1) in [self.model.hint_time, self.model.presentation_end, self.model.total_minutes]
+            b = BORDER_THICKNESS * 1.5 if self.model.is_paused and is_last_min else BORDER_THICKNESS
+            geometry.append((rect, b, i * 60, (i + 1) * 60))
+        self._marble_geometry = geometry
+        self._geometry_key = key
+
+    def _sized_label_font(self, point_size: int) -> QtGui.QFont:
+        # All labels share one size, derived from the bar height; rebuild the font only when that changes.
+        if self._label_font.pointSize() != point_size:
+            self._label_font.setPointSize(point_size)
+        return self._label_font
+
+    def _new_pixmap(self) -> QtGui.QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def _update_marble_pixmap(self, rr_size: float, done: int) -> None:
+        # Every marble except the in-progress one only changes when a minute completes,
+        # so they are rasterized once into a pixmap and blitted on each paint.
+        key = (self.size(), self.devicePixelRatioF(), self._geometry_key, self._palette_key, rr_size, done)
+        if key == self._marble_pixmap_key:
+            return
+
+        # Marbles before the in-progress one are finished and the ones after it are pending, so each
+        # side is walked as a slice. Marbles never overlap, so those sharing a pen and brush are
+        # collected into one path and drawn with a single call.
+        batches = {}
+        for start, stop, finished in ((0, done, True), (done + 1, len(self._marble_geometry), False)):
+            geometry = self._marble_geometry[start:stop]
+            colors = self._marble_colors[start:stop]
+            for (rect, b, s_sec, e_sec), palette in zip(geometry, colors):
+                batch_key = (id(palette), finished, b)
+                batch = batches.get(batch_key)
+                if batch is None:
+                    light_fill, dark_fill, dark_pen_color, light_pen_color = palette
+                    if finished:
+                        pen_color, fill = light_pen_color, dark_fill
+                    else:
+                        pen_color, fill = dark_pen_color, light_fill
+                    batch = batches[batch_key] = (QPen(pen_color, b), fill, QtGui.QPainterPath())
+                if rr_size < 1.0:
+                    batch[2].addRect(rect)
+                else:
+                    batch[2].addRoundedRect(rect, rr_size, rr_size)
+
+        pixmap = self._new_pixmap()
+        painter = QtGui.QPainter(pixmap)
+        # Rendered only when a minute completes or the layout changes, so antialiasing costs nothing per tick.
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        for pen, fill, path in batches.values():
+            painter.setPen(pen)
+            painter.setBrush(fill)
+            painter.drawPath(path)
+        painter.end()
+        self._marble_pixmap = pixmap
+        self._marble_pixmap_key = key
+
     def paintEvent(self, event):
+        # Read the clock once per paint; every element below is drawn from this same value.
+        el = min(self.model.elapsed(), self.model.total_minutes * 60.0)
+        if not self.model.is_paused:
+            painter = QtGui.QPainter(self)
+            self.paintBar(painter, el)
+            return
+
+        # The paused bar is static until the state, settings or size change,
+        # so it is rendered once into a pixmap and blitted on later repaints.
+        key = (
+            self.size(),
+            self.devicePixelRatioF(),
+            self.position,
+            self.model.hint_time,
+            self.model.presentation_end,
+            self.model.total_minutes,
+            el,
+        )
+        if self._paused_pixmap is None or key != self._paused_pixmap_key:
+            pixmap = self._new_pixmap()
+            pixmap_painter = QtGui.QPainter(pixmap)
+            pixmap_painter.setFont(self.font())
+            self.paintBar(pixmap_painter, el)
+            pixmap_painter.end()
+            self._paused_pixmap = pixmap
+            self._paused_pixmap_key = key
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._paused_pixmap)
+
+    def paintBar(self, painter: QtGui.QPainter, el: float) -> None:
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
 
         w, h = self.width() - MARGIN_X * 2, (self.height() if self.model.is_paused else self.running_height)
         marble_width = w / self.model.total_minutes
         rr_size = max(0.0, (h - 2 * PADDING) / 5)
-        marker_color = QColor(*MARKER_RGBA)
-        marker_border_color = QColor(*MARKER_BORDER_RGBA)
-        el = self.model.elapsed()
-        el = min(el, self.model.total_minutes * 60.0)
+        self._update_palette()
 
         # Draw marbles
-        for i in range(self.model.total_minutes):
-            x = i * marble_width + MARGIN_X
-            marble_height = h if (i + 1) % 10 == 0 else int(h / TEN_MINUTE_MARK_HEIGHT_SCALE)
-            y = h - marble_height if self.position == "bottom" else 0
-            rect = QRectF(x + PADDING, y + PADDING, marble_width - 2 * PADDING, marble_height - 2 * PADDING)
-            base = (
-                HINT_RGB
-                if i < self.model.hint_time
-                else PRESENTATION_RGB if i < self.model.presentation_end else TOTAL_RGB
-            )
-            light_fill_color = QColor(*interpolate_rgb(base, (255, 255, 255), 0.70), 150)
-            dark_fill_color = QColor(*base, 220)
-            dark_pen_color = QColor(*base)
-            light_pen_color = QColor(*interpolate_rgb(base, (255, 255, 255), 0.70))
-            is_last_min = (i + 1) in [self.model.hint_time, self.model.presentation_end, self.model.total_minutes]
-            b = BORDER_THICKNESS * 1.5 if self.model.is_paused and is_last_min else BORDER_THICKNESS
-
-            s_sec, e_sec = i * 60, (i + 1) * 60
-            if el >= e_sec:
-                painter.setPen(QPen(light_pen_color, b))
-                painter.setBrush(dark_fill_color)
-                painter.drawRoundedRect(rect, rr_size, rr_size)
-            elif el < s_sec:
-                painter.setPen(QPen(dark_pen_color, b))
-                painter.setBrush(light_fill_color)
-                painter.drawRoundedRect(rect, rr_size, rr_size)
+        self._update_geometry(w, h)
+        done = min(int(el // 60), self.model.total_minutes)
+        self._update_marble_pixmap(rr_size, done)
+        painter.drawPixmap(0, 0, self._marble_pixmap)
+
+        if done < self.model.total_minutes:
+            rect, b, s_sec, e_sec = self._marble_geometry[done]
+            frac = (el - s_sec) / 60.0
+            light_fill, dark_fill, dark_pen_color, light_pen_color = self._marble_colors[done]
+            pen = self._marble_pen
+            pen.setWidthF(b)
+            pen.setColor(dark_pen_color)
+            painter.setPen(pen)
+            painter.setBrush(light_fill)
+            # A corner radius below one pixel is invisible, so plain rects skip the corner arcs.
+            if rr_size < 1.0:
+                painter.drawRect(rect)
             else:
-                frac = (el - s_sec) / 60.0
-                painter.setPen(QPen(dark_pen_color, b))
-                painter.setBrush(light_fill_color)
                 painter.drawRoundedRect(rect, rr_size, rr_size)
 
-                dw = rect.width() * frac
-                clip = QRectF(rect.left(), 0, dw, self.height())
-                painter.save()
-                painter.setClipRect(clip)
-                painter.setPen(QPen(light_pen_color, b))
-                painter.setBrush(dark_fill_color)
-                painter.drawRoundedRect(rect, rr_size, rr_size)
-                painter.restore()
+            dw = rect.width() * frac
+            if dw >= 1.0:
+                # Pen and brush are set explicitly by every later draw, so only the clip needs undoing;
+                # this avoids pushing and popping the whole painter state.
+                painter.setClipRect(QRectF(rect.left(), 0, dw, self.height()))
+                pen.setColor(light_pen_color)
+                painter.setPen(pen)
+                painter.setBrush(dark_fill)
+                if rr_size < 1.0:
+                    painter.drawRect(rect)
+                else:
+                    painter.drawRoundedRect(rect, rr_size, rr_size)
+                painter.setClipping(False)
 
         marble_height = int(h / TEN_MINUTE_MARK_HEIGHT_SCALE)
         y = h - marble_height if self.position == "bottom" else 0
@@ -171,25 +335,24 @@ class TimerBar(QtWidgets.QWidget):
         if self.model.is_paused:
             # Draw play button
             s = marble_height - 2 * PADDING
-            px = MARGIN_X + PADDING + MARKER_BORDER_THICKNESS
             py = y + PADDING
-            tri = QtGui.QPolygonF(
-                [
-                    QPointF(px + s * 0.3, py + s * 0.15),
-                    QPointF(px + s * 0.3, py + s * 0.85),
-                    QPointF(px + s * 0.8, py + s * 0.5),
-                ]
-            )
-            painter.setBrush(marker_color)
-            painter.setPen(QPen(marker_border_color, MARKER_BORDER_THICKNESS))
-            painter.drawPolygon(tri)
+            if self._play_button_key != (s, py):
+                px = MARGIN_X + PADDING + MARKER_BORDER_THICKNESS
+                self._play_button = QtGui.QPolygonF(
+                    [
+                        QPointF(px + s * 0.3, py + s * 0.15),
+                        QPointF(px + s * 0.3, py + s * 0.85),
+                        QPointF(px + s * 0.8, py + s * 0.5),
+                    ]
+                )
+                self._play_button_key = (s, py)
+            painter.setBrush(self._marker_brush)
+            painter.setPen(self._marker_border_pen)
+            painter.drawPolygon(self._play_button)
 
             # Draw hint/presentation/total times
-            font = painter.font()
-            font.setPointSizeF(s * 0.7)
-            font.setBold(True)
-            painter.setFont(font)
             s = marble_height - 2 * PADDING - MARKER_BORDER_THICKNESS * 2
+            painter.setFont(self._sized_label_font(int(s * 0.6)))
             for mark, shadow_rgb in zip(
                 [self.model.hint_time, self.model.presentation_end, self.model.total_minutes],
                 [HINT_RGB, PRESENTATION_RGB, TOTAL_RGB],
@@ -201,7 +364,6 @@ class TimerBar(QtWidgets.QWidget):
                 paint_text_with_background(
                     painter, box, str(mark), MARKER_RGBA, shadow_rgba,
                     text_align="right",
-                    font_size = int(box.height() * 0.6),
                     corner_radius=rr_size,
                     margin=rr_size,
                 )
@@ -212,12 +374,12 @@ class TimerBar(QtWidgets.QWidget):
             hand_size = max(4.0, (marble_height - 2 * PADDING) * scale)
             hx = w * (el / (self.model.total_minutes * 60)) - hand_size / 2 + MARGIN_X
             if self.model.is_paused:
-                painter.setBrush(marker_color)
-                painter.setPen(QPen(marker_border_color, MARKER_BORDER_THICKNESS))
+                painter.setBrush(self._marker_brush)
+                painter.setPen(self._marker_border_pen)
             else:
                 p = 1.0 - ((math.cos(el * 2 * math.pi / 3.0) + 1.0) / 2) ** 2
-                c = interpolate_rgba(MARKER_RGBA, MARKER_DARK_RGBA, p)
-                painter.setBrush(QColor(*c))
+                self._hand_color.setRgb(*interpolate_rgba(MARKER_RGBA, MARKER_DARK_RGBA, p))
+                painter.setBrush(self._hand_color)
                 painter.setPen(Qt.NoPen)
             painter.drawEllipse(QRectF(hx, y + (marble_height - hand_size) / 2, hand_size, hand_size))
 
@@ -226,17 +388,13 @@ class TimerBar(QtWidgets.QWidget):
             marble_height = int(h / TEN_MINUTE_MARK_HEIGHT_SCALE)
             y = h - marble_height if self.position == "bottom" else 0
             s = marble_height - 2 * PADDING - MARKER_BORDER_THICKNESS * 2
-            font = painter.font()
-            font.setPointSizeF(s * 0.7)
-            font.setBold(True)
-            painter.setFont(font)
+            painter.setFont(self._sized_label_font(int(s * 0.6)))
             box = QRectF(hx + hand_size + rr_size, y + PADDING, w, s)
             els = int(el)
             text = "%02d:%02d" % (els // 60, els % 60)
             paint_text_with_background(
                 painter, box, text, MARKER_RGBA, MARKER_BORDER_RGBA,
                 text_align="left",
-                font_size = int(box.height() * 0.6),
                 corner_radius=rr_size,
                 margin=rr_size,
             )
@@ -257,49 +415,85 @@ class PresentationTimerWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(self.timerBar)
         self.setWindowFlags(Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self._setup_menu()
         model.stateChanged.connect(self.adjustPosition)
+        app = QtWidgets.QApplication.instance()
+        app.screenAdded.connect(self.onScreenAdded)
+        app.screenRemoved.connect(self.onScreenRemoved)
+        app.primaryScreenChanged.connect(self.onPrimaryScreenChanged)
+        for scr in app.screens():
+            scr.availableGeometryChanged.connect(self.adjustPosition)
+        self.refreshScreen()
+        self.adjustPosition()
+
+    def refreshScreen(self, removed: Optional[QtGui.QScreen] = None):
+        # The target screen only changes when the screen list does (added, removed, or reordered by a
+        # primary screen change), so it is looked up here rather than on every adjustPosition.
+        screens = [scr for scr in QtWidgets.QApplication.screens() if scr is not removed]
+        if not screens:
+            # The last screen went away; keep the previous one until a screen is added again.
+            return
+        self._screen = screens[self.display_index] if self.display_index < len(screens) else screens[0]
+
+    def onScreenAdded(self, scr: QtGui.QScreen):
+        scr.availableGeometryChanged.connect(self.adjustPosition)
+        self.refreshScreen()
+        self.adjustPosition()
+
+    def onScreenRemoved(self, scr: QtGui.QScreen):
+        self.refreshScreen(removed=scr)
+        if self._screen is not scr:
+            self.adjustPosition()
+
+    def onPrimaryScreenChanged(self, scr: QtGui.QScreen):
+        self.refreshScreen()
         self.adjustPosition()
 
     def adjustPosition(self):
-        screens = QtWidgets.QApplication.screens()
-        scr = screens[self.display_index] if self.display_index < len(screens) else screens[0]
-        avail = scr.availableGeometry()
+        avail = self._screen.availableGeometry()
         h = self.paused_h if self.model.is_paused else self.running_h
         x = avail.left() + self.margin
         w = avail.width() - 2 * self.margin
         y = avail.top() + self.margin if self.position == "top" else avail.bottom() - h - self.margin
-        self.setGeometry(x, y, w, h)
+        # Screen signals can fire without the target geometry changing; skip the window-manager round trip then.
+        if self.geometry() != QRect(x, y, w, h):
+            self.setGeometry(x, y, w, h)
         self.timerBar.position = self.position
 
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if e.type() == QtCore.QEvent.WindowStateChange:
+            # A minimized bar cannot be seen, so let the app drop the tick timer until it is restored.
+            self.manager.update_tick_timer()
+
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton and self.model.is_paused and e.pos().x() < self.paused_h:
             self.model.toggle_pause()
             return
         if e.button() in (Qt.LeftButton, Qt.RightButton):
-            menu = QtWidgets.QMenu(self)
-            resume = menu.addAction("Resume / Pause")
-            change = menu.addAction("Change Bell Times")
-            menu.addSeparator()
-            move_top = menu.addAction("Move to Top")
-            move_bottom = menu.addAction("Move to Bottom")
-            menu.addSeparator()
-            cyc = menu.addAction("Cycle Display Target")
-            cyc.triggered.connect(self.manager.cycle_display_target)
-            menu.addSeparator()
-            exit_a = menu.addAction("Exit")
-            action = menu.exec_(e.globalPos())
-            if action == resume:
-                self.model.toggle_pause()
-            elif action == move_top:
-                self.position = "top"
-                self.adjustPosition()
-            elif action == move_bottom:
-                self.position = "bottom"
-                self.adjustPosition()
-            elif action == change:
-                self.manager.update_time_settings()
-            elif action == exit_a:
-                QtWidgets.QApplication.quit()
+            self.menu.exec_(e.globalPos())
+
+    def _setup_menu(self):
+        self.menu = QtWidgets.QMenu(self)
+        resume = self.menu.addAction("Resume / Pause")
+        resume.triggered.connect(self.model.toggle_pause)
+        change = self.menu.addAction("Change Bell Times")
+        change.triggered.connect(self.manager.update_time_settings)
+        self.menu.addSeparator()
+        move_top = self.menu.addAction("Move to Top")
+        move_top.triggered.connect(lambda: self.moveTo("top"))
+        move_bottom = self.menu.addAction("Move to Bottom")
+        move_bottom.triggered.connect(lambda: self.moveTo("bottom"))
+        self.menu.addSeparator()
+        cyc = self.menu.addAction("Cycle Display Target")
+        cyc.triggered.connect(self.manager.cycle_display_target)
+        self.menu.addSeparator()
+        exit_a = self.menu.addAction("Exit")
+        exit_a.triggered.connect(QtWidgets.QApplication.quit)
+
+    def moveTo(self, pos: str):
+        self.position = pos
+        self.adjustPosition()
 
 
 # ---- Manager / Application ----
@@ -323,6 +517,10 @@ class PresentationTimerApp:
 
         # TimerModel remains the same
         self.model = TimerModel(args.time1, args.time2, args.time3)
+        # Created before the windows, whose state changes may already ask update_tick_timer for it.
+        self.tick_timer = QtCore.QTimer()
+        self.tick_timer.setInterval(TICK_INTERVAL_MS)
+        self.tick_timer.timeout.connect(self.model.tick)
 
         # Gather all screens
         screens = self.app.screens()
@@ -344,35 +542,45 @@ class PresentationTimerApp:
             w = PresentationTimerWindow(self, self.model, idx, args.pos, args.pixel_height)
             self.windows.append(w)
 
+        # Precompute which windows are shown in each cycle mode
+        self.display_visibility: List[Tuple[bool, ...]] = [
+            tuple(mode is None or win.display_index == mode for win in self.windows) for mode in self.display_modes
+        ]
+
         # Show initial set of windows
         self.update_window_visibility()
 
         # Set up system tray, tick timer, etc. (unchanged)
         self._setup_tray()
-        self.tick_timer = QtCore.QTimer()
-        self.tick_timer.timeout.connect(self.model.tick)
-        self.tick_timer.start(100)
+        self.model.stateChanged.connect(self.update_tick_timer)
+        self.update_tick_timer()
+
+    def update_tick_timer(self):
+        # The bar is static while paused or hidden, so only keep the timer (and its wakeups) alive while running.
+        running = not self.model.is_paused and any(
+            win.isVisible() and not win.isMinimized() for win in self.windows
+        )
+        if running and not self.tick_timer.isActive():
+            self.tick_timer.start()
+        elif not running and self.tick_timer.isActive():
+            self.tick_timer.stop()
 
     def cycle_display_target(self):
         self.current_display_mode = (self.current_display_mode + 1) % len(self.display_modes)
         self.update_window_visibility()
+        self.update_tick_timer()
 
     def update_window_visibility(self):
-        mode = self.display_modes[self.current_display_mode]
-        for win in self.windows:
-            if mode is None or win.display_index == mode:
-                win.show()
-            else:
-                win.hide()
+        for win, visible in zip(self.windows, self.display_visibility[self.current_display_mode]):
+            win.setVisible(visible)
 
     def _setup_tray(self):
         self.tray = TrayIcon(self.app)
-        app_icon = find_icon_file("icon.ico")
-        if app_icon:
-            qicon = QtGui.QIcon(app_icon)
+        # main() normally sets the application icon already; reuse it rather than decoding the file again.
+        qicon = self.app.windowIcon()
+        if qicon.isNull() and ICON_PATH:
+            qicon = QtGui.QIcon(ICON_PATH)
             self.app.setWindowIcon(qicon)
-        else:
-            qicon = self.app.windowIcon()
         self.tray.setIcon(qicon)
 
         menu = QtWidgets.QMenu()
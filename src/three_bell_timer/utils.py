@@ -1,13 +1,11 @@
 import colorsys
-import os
-import platform
-import shutil
+import functools
 import sys
 from typing import Optional, Tuple
 
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import QPoint, QPointF, QRect, QRectF, QSize, Qt
-from PyQt5.QtGui import QPainter, QColor, QFontMetrics, QBrush
+from PyQt5.QtGui import QPainter, QColor, QFontMetrics, QBrush, QStaticText
 
 
 def clip01(v: float) -> float:
@@ -56,54 +54,6 @@ def interpolate_rgba(
     return (r, g, b, a)
 
 
-def generate_desktop_file():
-    if platform.system() != "Linux":
-        sys.exit("Error: .desktop file is valid only on Linux system.")
-
-    exec_path = shutil.which("3bt") or os.path.abspath(sys.argv[0])
-
-    icon_path = find_icon_file("icon256.png") or ""
-
-    desktop_file_content = f"""[Desktop Entry]
-Name=Three-bell timer
-Comment=A lightweight timer designed for presentations.
-Exec={exec_path}
-Icon={icon_path}
-Terminal=false
-Type=Application
-Categories=Utility;
-"""
-    dest_file = os.path.join(os.getcwd(), "3bt.desktop")
-
-    try:
-        with open(dest_file, "w") as f:
-            f.write(desktop_file_content)
-        print(f".desktop file generated at {dest_file}", file=sys.stderr)
-        print("To integrate with your system, copy this file to ~/.local/share/applications/", file=sys.stderr)
-        print("For example:", file=sys.stderr)
-        print("  cp 3bt.desktop ~/.local/share/applications/", file=sys.stderr)
-    except Exception as e:
-        sys.exit(f"Error: Failed to generate .desktop file: {e}")
-
-
-def find_icon_file(filename):
-    base_dirs = []
-    pkg_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "data"))
-    base_dirs.append(pkg_data_dir)
-    try:
-        pyinstaller_data_dir = sys._MEIPASS
-        base_dirs.append(pyinstaller_data_dir)
-    except Exception:
-        pass
-    base_dirs.append(os.path.abspath("."))
-
-    for b in base_dirs:
-        icon_path = os.path.join(b, filename)
-        if os.path.exists(icon_path):
-            return icon_path
-    return None
-
-
 def calculate_window_position(cursor_pos: QPoint, window_size: QSize, margin: int = 10) -> QPoint:
     """Calculates an appropriate top-left position for a window near the cursor.
 
@@ -187,6 +137,15 @@ def calculate_window_position(cursor_pos: QPoint, window_size: QSize, margin: in
     return QPoint(target_x, target_y)
 
 
+@functools.lru_cache(maxsize=64)
+def _static_text(text: str) -> QStaticText:
+    # QStaticText keeps its glyph layout between draws, so labels repainted with the same text
+    # and font skip Qt's text layout.
+    static_text = QStaticText(text)
+    static_text.setTextFormat(Qt.PlainText)
+    return static_text
+
+
 def paint_text_with_background(
     painter: QPainter,
     rect: QRect,
@@ -200,11 +159,12 @@ def paint_text_with_background(
     corner_radius: int = 8,
 ):
     font = painter.font()
-    if font_name is not None:
-        font.setFamily(font_name)
-    if font_size is not None:
-        font.setPointSize(font_size)
-    painter.setFont(font)
+    if font_name is not None or font_size is not None:
+        if font_name is not None:
+            font.setFamily(font_name)
+        if font_size is not None:
+            font.setPointSize(font_size)
+        painter.setFont(font)
 
     metrics = QFontMetrics(font)
 
@@ -235,4 +195,4 @@ def paint_text_with_background(
 
     text_color = QColor(*text_rgba)
     painter.setPen(text_color)
-    painter.drawText(QPointF(x, y), text)
+    painter.drawStaticText(QPointF(x, y - metrics.ascent()), _static_text(text))